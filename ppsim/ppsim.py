@@ -35,16 +35,18 @@ counts of all states and how they change over time.
 convergence time of a protocol.
 """
 
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import nullcontext
 import dataclasses
 from dataclasses import dataclass
-from datetime import timedelta
 import math
 from time import perf_counter
 from typing import Union, Hashable, Dict, Tuple, Callable, Optional, List, Iterable, Set
 
 import ipywidgets as widgets
 import matplotlib.pyplot as plt
-from natsort import natsorted
+from natsort import index_natsorted
 import numpy as np
 import pandas as pd
 import seaborn as sns
@@ -74,23 +76,41 @@ def state_enumeration(init_dist: Dict[State, int], rule: Callable[[State, State]
     Returns:
         a set of all reachable states
     """
-    checked_states = set()
-    unchecked_states = set(init_dist.keys())
-    while len(unchecked_states) > 0:
-        unchecked_state = unchecked_states.pop()
-        if unchecked_state not in checked_states:
-            checked_states.add(unchecked_state)
-        for checked_state in checked_states:
-            for new_states in [rule(checked_state, unchecked_state),
-                               rule(unchecked_state, checked_state)]:
+    # every state that has been discovered, whether or not it has been expanded yet
+    visited = set(init_dist.keys())
+    # frontier of discovered states that have not yet been paired with the expanded states
+    frontier = deque(visited)
+    expanded = []
+    while frontier:
+        state = frontier.popleft()
+        expanded.append(state)
+        # each unordered pair is evaluated exactly once, when its later member is expanded
+        for other_state in expanded:
+            for new_states in [rule(other_state, state), rule(state, other_state)]:
                 if new_states is not None:
-                    if isinstance(new_states, dict):
-                        # if the output is a distribution
-                        new_states = sum(new_states.keys(), ())
-                    for new_state in new_states:
-                        if new_state not in checked_states and new_state not in unchecked_states:
-                            unchecked_states.add(new_state)
-    return checked_states
+                    # if the output is a distribution, check the states of every possible output pair
+                    output_pairs = new_states.keys() if isinstance(new_states, dict) else (new_states,)
+                    for output_pair in output_pairs:
+                        for new_state in output_pair:
+                            if new_state not in visited:
+                                visited.add(new_state)
+                                frontier.append(new_state)
+    return visited
+
+
+def _sorts_like_natsort(states: List[State]) -> bool:
+    """Checks whether sorting states directly gives the same order as natsort on their repr.
+
+    This holds for non-negative integers, and for tuples of one type and length holding
+    non-negative integers, since natsort then compares the same integers in the same order.
+    Negative integers, bools, or tuples of different lengths or types can be ordered differently.
+    """
+    if all(type(state) is int and state >= 0 for state in states):
+        return True
+    tuple_type = type(states[0])
+    return issubclass(tuple_type, tuple) and all(
+        type(state) is tuple_type and len(state) == len(states[0])
+        and all(type(x) is int and x >= 0 for x in state) for state in states)
 
 
 class Snapshot:
@@ -127,6 +147,14 @@ class Snapshot:
         """
         pass
 
+    def reset(self):
+        """Method which is called when the Simulation is reset.
+
+        Any data cached from the previous history of self.simulation should be
+        cleared here.
+        """
+        pass
+
     def update(self, index: Optional[int] = None):
         """Method which is called while the Simulation is running.
 
@@ -136,7 +164,7 @@ class Snapshot:
                 self.sim.times[index]. Otherwise, the snapshot will use the current
                 configuration self.sim.config_array and current time self.sim.time.
         """
-        if type(index) is int:
+        if isinstance(index, (int, np.integer)):
             self.time = self.simulation.times[index]
             self.config = self.simulation.configs[index]
         else:
@@ -169,14 +197,8 @@ class Simulation:
     simulator: simulator.Simulator
     """An internal Simulator object, whose methods actually
             perform the steps of the simulation."""
-    configs: List[np.ndarray]
-    """A list of all configurations that have been
-            recorded during the simulation, as integer arrays."""
     time: float
     """The current time of the Simulation."""
-    times: List[Union[float, timedelta]]
-    """A list of all the corresponding times for configs,
-            in units of parallel time."""
     steps_per_time_unit: float
     """Number of simulated interactions per time unit."""
     time_units: Optional[str]
@@ -255,6 +277,10 @@ class Simulation:
         """
         self.seed = seed
         self.rng = np.random.default_rng(seed)
+        # pool of pre-sampled poisson random variables with mean _poisson_mean, used by time_to_steps
+        self._poisson_mean = None
+        self._poisson_pool = []
+        self._poisson_batch_size = 1
         self.n = sum(init_config.values())
         self.steps_per_time_unit = self.n
         self.time_units = time_units
@@ -279,10 +305,27 @@ class Simulation:
 
         self._rule = rule
         self._rule_kwargs = kwargs
+        # Choose the specialized version of self.rule once, rather than checking the rule type on every call
+        if isinstance(self._rule, dict):
+            self._rule_function = self._rule_from_dict
+        elif callable(self._rule):
+            # Only copy dataclass states before each call if the function could mutate them
+            if any(dataclasses.is_dataclass(state) and not type(state).__dataclass_params__.frozen
+                   for state in init_config):
+                self._rule_function = self._rule_from_dataclass_callable
+            else:
+                self._rule_function = self._rule_from_callable
+        else:
+            raise TypeError("rule must be either a dict or a callable.")
 
         # Get a list of all reachable states, use the natsort library to put in a nice order.
-        self.state_list = natsorted(list(state_enumeration(init_config, self.rule)),
-                                    key=lambda x: repr(x))
+        states = list(state_enumeration(init_config, self._rule_function))
+        if _sorts_like_natsort(states):
+            self.state_list = sorted(states)
+        else:
+            # sort precomputed string keys, rather than calling repr through a key function
+            order = index_natsorted([repr(state) for state in states])
+            self.state_list = [states[i] for i in order]
         # TODO: process a dictionary in a more straightforward way, and check that state_list only includes
         #         states in the dictionary
         self.state_dict = {state: i for i, state in enumerate(self.state_list)}
@@ -314,31 +357,53 @@ class Simulation:
             self.column_names = pd.MultiIndex.from_tuples(tuples, names=field_names)
         else:
             self.column_names = [str(i) for i in self.state_list]
-        self.configs = []
-        self.times = []
+        # configs and times are stored in buffers that grow geometrically, the first _num_configs rows are recorded
+        self._configs = np.empty((64, len(self.state_list)), dtype=np.int64)
+        self._times = np.empty(64, dtype=float)
+        self._num_configs = 0
         self.time = 0
         self.add_config()
-        # private history dataframe is initially empty, updated by the getter of property self.history
-        self._history = pd.DataFrame(data=self.configs, index=pd.Index(self.times_in_units(self.times)),
-                                     columns=self.column_names)
+        # private history dataframe is built lazily by the getter of property self.history,
+        # and is rebuilt only when more than _history_len configs have been recorded
+        self._history = None
+        self._history_len = 0
+        # index of the recorded times in units, extended by time_index with only the newly recorded times
+        self._time_index = None
+        self._time_index_len = 0
         self.snapshots = []
 
+    @property
+    def configs(self) -> np.ndarray:
+        """An array of all configurations that have been recorded during the
+        simulation, with one row for each recorded configuration."""
+        return self._configs[:self._num_configs]
+
+    @property
+    def times(self) -> np.ndarray:
+        """An array of all the corresponding times for configs,
+        in units of parallel time."""
+        return self._times[:self._num_configs]
+
     def rule(self, a, b):
         """The rule, as a function of two input states."""
-        # If the input rule was a dict
-        if type(self._rule) == dict:
-            if (a, b) in self._rule:
-                return self._rule[(a, b)]
-        # If the input rule was a function, with possible kwargs
-        elif callable(self._rule):
-            # Make a fresh copy in the case of a dataclass in case the function mutates a, b
-            if dataclasses.is_dataclass(a):
-                a, b = dataclasses.replace(a), dataclasses.replace(b)
-            output = self._rule(a, b, **self._rule_kwargs)
-            # If function just mutates a, b but doesn't return, then return new a, b values
-            return (a, b) if output is None else output
-        else:
-            raise TypeError("rule must be either a dict or a callable.")
+        return self._rule_function(a, b)
+
+    def _rule_from_dict(self, a, b):
+        """The rule when the input rule was a dict."""
+        return self._rule.get((a, b))
+
+    def _rule_from_callable(self, a, b):
+        """The rule when the input rule was a function, with possible kwargs."""
+        output = self._rule(a, b, **self._rule_kwargs)
+        # If function just mutates a, b but doesn't return, then return new a, b values
+        return (a, b) if output is None else output
+
+    def _rule_from_dataclass_callable(self, a, b):
+        """The rule when the input rule was a function acting on dataclass states."""
+        # Make a fresh copy in the case of a dataclass in case the function mutates a, b
+        if dataclasses.is_dataclass(a):
+            a, b = dataclasses.replace(a), dataclasses.replace(b)
+        return self._rule_from_callable(a, b)
 
     def initialize_simulator(self, config):
         """Build the data structures necessary to instantiate the Simulator class.
@@ -347,16 +412,29 @@ class Simulation:
             config: The config array to instantiate the Simulator.
         """
         q = len(self.state_list)
-        delta = np.zeros((q, q, 2), dtype=np.intp)
+        # delta and random_transitions are views into one table, so that all integer data for the pair (i, j)
+        # is contiguous and the simulator reads it from a single cache line
+        # int32 indices halve the memory footprint of the table compared to np.intp
+        transitions = np.zeros((q, q, 4), dtype=np.int32)
+        delta = transitions[:, :, 0:2]
+        random_transitions = transitions[:, :, 2:4]
         null_transitions = np.zeros((q, q), dtype=bool)
-        random_transitions = np.zeros((q, q, 2), dtype=np.intp)
         random_outputs = []
         transition_probabilities = []
+        rule = self._rule_function
+        # Outputs are often the very objects in self.state_list (e.g. from a dict rule), which can be found by id
+        # without hashing and comparing the states. Any other equal object is looked up in self.state_dict.
+        index_by_id = {id(state): i for i, state in enumerate(self.state_list)}
+
+        def state_index(state):
+            index = index_by_id.get(id(state))
+            return self.state_dict[state] if index is None else index
+
         for i, a in enumerate(self.state_list):
             for j, b in enumerate(self.state_list):
-                output = self.rule(a, b)
+                output = rule(a, b)
                 # when output is a distribution
-                if type(output) == dict:
+                if isinstance(output, dict):
                     s = sum(output.values())
                     assert s <= 1, "The sum of output probabilities must be <= 1."
                     # ensure probabilities sum to 1
@@ -372,36 +450,41 @@ class Simulation:
                         # add (number of outputs, index to outputs)
                         random_transitions[i, j] = (len(output), len(random_outputs))
                         for (x, y) in output.keys():
-                            random_outputs.append((self.state_dict[x], self.state_dict[y]))
+                            random_outputs.append((state_index(x), state_index(y)))
                         transition_probabilities.extend(list(output.values()))
                 if output is None or set(output) == {a, b}:
                     null_transitions[i, j] = True
-                    delta[i, j] = (i, j)
-                elif type(output) == tuple:
-                    delta[i, j] = (self.state_dict[output[0]], self.state_dict[output[1]])
-        random_outputs = np.array(random_outputs, dtype=np.intp)
+                elif isinstance(output, tuple):
+                    delta[i, j] = (state_index(output[0]), state_index(output[1]))
+        # null transitions map each pair (i, j) back to itself
+        delta[null_transitions] = np.argwhere(null_transitions)
+        random_outputs = np.array(random_outputs, dtype=np.int32)
         transition_probabilities = np.array(transition_probabilities, dtype=float)
 
         if self._transition_order.lower() in ['symmetric', 'symmetric_enforced']:
-            for i in range(q):
-                for j in range(q):
-                    # Set the output for i, j to be equal to j, i if null
-                    if null_transitions[i, j]:
-                        null_transitions[i, j] = null_transitions[j, i]
-                        delta[i, j] = delta[j, i]
-                        random_transitions[i, j] = random_transitions[j, i]
-                    # If i, j and j, i are both non-null, with symmetric_enforced, check outputs are equal
-                    elif self._transition_order.lower() == 'symmetric_enforced' \
-                            and not null_transitions[j, i]:
-                        if sorted(delta[i, j]) != sorted(delta[j, i]) or \
-                                random_transitions[i, j, 0] != random_transitions[j, i, 0]:
-                            a, b = self.state_list[i], self.state_list[j]
-                            raise ValueError(f'''Asymmetric interaction:
-                                            {a, b} -> {self.rule(a, b)}
-                                            {b, a} -> {self.rule(b, a)}''')
+            # pairs where i, j and j, i are both non-null
+            both_non_null = np.triu(~null_transitions & ~null_transitions.T, k=1)
+            # Set the output for i, j to be equal to j, i if null
+            copy_transpose = null_transitions & ~null_transitions.T
+            null_transitions[copy_transpose] = False
+            delta[copy_transpose] = delta.transpose(1, 0, 2)[copy_transpose]
+            random_transitions[copy_transpose] = random_transitions.transpose(1, 0, 2)[copy_transpose]
+            # If i, j and j, i are both non-null, with symmetric_enforced, check outputs are equal
+            if self._transition_order.lower() == 'symmetric_enforced':
+                # compare the outputs as unordered pairs (lo, hi), along with the number of random outputs
+                lo, hi = delta.min(axis=2), delta.max(axis=2)
+                num_random = random_transitions[:, :, 0]
+                asymmetric = both_non_null & ((lo != lo.T) | (hi != hi.T) | (num_random != num_random.T))
+                if asymmetric.any():
+                    i, j = np.argwhere(asymmetric)[0]
+                    a, b = self.state_list[i], self.state_list[j]
+                    raise ValueError(f'''Asymmetric interaction:
+                                    {a, b} -> {self.rule(a, b)}
+                                    {b, a} -> {self.rule(b, a)}''')
 
         self.simulator = self._method(config, delta, null_transitions,
                                       random_transitions, random_outputs, transition_probabilities, self.seed)
+        self._update_config_array()
 
     def array_from_dict(self, d: Dict) -> np.ndarray:
         """Convert a configuration dictionary to an array.
@@ -412,10 +495,11 @@ class Simulation:
         Returns: An array giving counts of all states, in the order of
             self.state_list.
         """
-
+        # scatter all counts into the array with a single vectorized call
+        indices = np.fromiter((self.state_dict[k] for k in d), dtype=np.intp, count=len(d))
+        counts = np.fromiter(d.values(), dtype=np.int64, count=len(d))
         a = np.zeros(len(self.state_list), dtype=np.int64)
-        for k in d.keys():
-            a[self.state_dict[k]] += d[k]
+        np.add.at(a, indices, counts)
         return a
 
     def run(self, run_until: Union[float, ConvergenceDetector] = None, history_interval: float = 1.,
@@ -449,12 +533,12 @@ class Simulation:
         end_time = None
         # stop_condition() returns True when it is time to stop
         if run_until is None:
-            if type(self.simulator) != simulator.SimulatorMultiBatch:
+            if not isinstance(self.simulator, simulator.SimulatorMultiBatch):
                 raise ValueError('Running until silence only works with multibatch simulator.')
 
             def stop_condition():
                 return self.simulator.silent
-        elif type(run_until) is float or type(run_until) is int:
+        elif isinstance(run_until, (int, float)):
             end_time = self.time + run_until
 
             def stop_condition():
@@ -470,9 +554,11 @@ class Simulation:
         if stop_condition():
             return
 
+        history_interval_is_callable = callable(history_interval)
+
         def get_next_history_time():
             # Get the next time that will be recorded to self.times and self.history
-            if callable(history_interval):
+            if history_interval_is_callable:
                 length = history_interval(self.time)
             else:
                 length = history_interval
@@ -484,15 +570,9 @@ class Simulation:
             raise ValueError('stopping_interval must always be strictly positive.')
 
         next_history_time = get_next_history_time()
-
-        def get_next_time():
-            # Get the next time simulator will run until
-            t = min(next_history_time, self.time + stopping_interval)
-            if end_time is not None:
-                t = min(t, end_time)
-            return t
-
-        next_time = get_next_time()
+        # The simulator runs until the earliest of the next history time, the next stopping check and end_time
+        time_bound = math.inf if end_time is None else end_time
+        next_time = min(next_history_time, self.time + stopping_interval, time_bound)
         # The next step that the simulator will be run until, which corresponds to parallel time next_time
         next_step = self.time_to_steps(next_time)
 
@@ -501,29 +581,36 @@ class Simulation:
 
         # add max_wall_clock to be the minimum snapshot update time, to put a time bound on calls to simulator.run
         max_wallclock_time = [min([s.update_time for s in self.snapshots])] if len(self.snapshots) > 0 else []
+        # local names for everything used on each iteration of the loop
+        sim = self.simulator
+        time_to_steps = self.time_to_steps
+        snapshots = self.snapshots
         while stop_condition() is False:
             if self.time >= next_time:
-                next_step += self.time_to_steps(get_next_time() - next_time)
-                next_time = get_next_time()
-            current_step = self.simulator.t
-            self.simulator.run(next_step, *max_wallclock_time)
-            if self.simulator.t == next_step:
+                t = min(next_history_time, self.time + stopping_interval, time_bound)
+                next_step += time_to_steps(t - next_time)
+                next_time = t
+            current_step = sim.t
+            sim.run(next_step, *max_wallclock_time)
+            if sim.t == next_step:
                 self.time = next_time
-            elif self.simulator.t < next_step:
+            elif sim.t < next_step:
                 # simulator exited early from hitting max_wallclock_time
                 # add a fraction of the time until next_time equal to the fractional progress made by simulator
-                self.time += (next_time - self.time) * (self.simulator.t - current_step) / (next_step - current_step)
+                self.time += (next_time - self.time) * (sim.t - current_step) / (next_step - current_step)
             else:
-                raise RuntimeError('The simulator ran to step {self.simulator.t} past the next step {next_step}.')
+                raise RuntimeError(f'The simulator ran to step {sim.t} past the next step {next_step}.')
             if self.time >= next_history_time:
                 assert self.time == next_history_time, \
                     f'self.time = {self.time} overshot next_history_time = {next_history_time}'
                 self.add_config()
                 next_history_time = get_next_history_time()
-            for snapshot in self.snapshots:
-                if perf_counter() >= snapshot.next_snapshot_time:
-                    snapshot.update()
-                    snapshot.next_snapshot_time = perf_counter() + snapshot.update_time
+            if snapshots:
+                now = perf_counter()
+                for snapshot in snapshots:
+                    if now >= snapshot.next_snapshot_time:
+                        snapshot.update()
+                        snapshot.next_snapshot_time = perf_counter() + snapshot.update_time
         # add the final configuration if it wasn't already recorded
         if self.time > self.times[-1]:
             self.add_config()
@@ -543,7 +630,7 @@ class Simulation:
         Each reaction is separated by newlines, so that ``print(self.reactions)`` will display all reactions.
         Only works with simulator method multibatch, otherwise will raise a ValueError.
         """
-        if type(self.simulator) != simulator.SimulatorMultiBatch:
+        if not isinstance(self.simulator, simulator.SimulatorMultiBatch):
             raise ValueError('reactions must be defined by multibatch simulator.')
         w = max([len(str(state)) for state in self.state_list])
         reactions = [self._reaction_string(r, p, w) for (r, p) in
@@ -559,7 +646,7 @@ class Simulation:
         Each reaction is separated by newlines, so that ``print(self.enabled_reactions)``
         will display all enabled reactions.
         """
-        if type(self.simulator) != simulator.SimulatorMultiBatch:
+        if not isinstance(self.simulator, simulator.SimulatorMultiBatch):
             raise ValueError('reactions must be defined by multibatch simulator.')
         w = max([len(str(state)) for state in self.state_list])
         self.simulator.get_enabled_reactions()
@@ -590,16 +677,22 @@ class Simulation:
                 If None, will use the old initial configuration.
         """
         if init_config is None:
-            config = self.configs[0]
+            # copy, since the simulator will modify the config array in place
+            config = self.configs[0].copy()
         else:
-            config = np.zeros(len(self.state_list), dtype=np.int64)
-            for k in init_config.keys():
-                config[self.state_dict[k]] += init_config[k]
-        self.configs = [config]
-        self.times = [0]
-        self._history = pd.DataFrame(data=self.configs, index=pd.Index(self.times, name='time'),
-                                     columns=self._history.columns)
+            config = self.array_from_dict(init_config)
+        self._configs[0] = config
+        self._times[0] = 0
+        self._num_configs = 1
+        self.time = 0
+        self._history = None
+        self._history_len = 0
+        self._time_index = None
+        self._time_index_len = 0
         self.simulator.reset(config)
+        self._update_config_array()
+        for snapshot in self.snapshots:
+            snapshot.reset()
 
     # TODO: If this changes n, then the timescale must change
     def set_config(self, config: Union[Dict[State, int], np.ndarray]) -> None:
@@ -610,11 +703,12 @@ class Simulation:
                 mapping states to counts, or an array giving counts in the order
                 of state_list.
         """
-        if type(config) is dict:
+        if isinstance(config, dict):
             config_array = self.array_from_dict(config)
         else:
             config_array = np.array(config, dtype=np.int64)
         self.simulator.reset(config_array, self.simulator.t)
+        self._update_config_array()
         self.add_config()
 
     def time_to_steps(self, time: float) -> int:
@@ -627,7 +721,19 @@ class Simulation:
         if self.continuous_time:
             # In continuous time the number of steps is a poisson random variable
             # TODO: handle the case when expected_steps is larger than an int32 and numpy reports a ValueError
-            return self.rng.poisson(expected_steps)
+            if expected_steps != self._poisson_mean:
+                # pooled samples are only valid for the mean they were sampled with
+                self._poisson_mean = expected_steps
+                self._poisson_pool = []
+                self._poisson_batch_size = 1
+            if not self._poisson_pool:
+                # the batch size doubles each time the pool runs out with the same mean, so a mean that
+                # keeps changing draws one sample per call, and at most about half of the samples drawn
+                # for one mean get discarded. The batch is reversed so that pop() returns the samples in
+                # the order they were sampled.
+                self._poisson_pool = self.rng.poisson(expected_steps, size=self._poisson_batch_size).tolist()[::-1]
+                self._poisson_batch_size = min(2 * self._poisson_batch_size, 4096)
+            return self._poisson_pool.pop()
         else:
             # In discrete time we round up to the next step
             return math.ceil(expected_steps)
@@ -635,7 +741,9 @@ class Simulation:
     @property
     def config_dict(self) -> Dict[State, int]:
         """The current configuration, as a dictionary mapping states to counts."""
-        return {self.state_list[i]: self.simulator.config[i] for i in np.nonzero(self.simulator.config)[0]}
+        config = self.config_array
+        nonzero = np.flatnonzero(config)
+        return dict(zip([self.state_list[i] for i in nonzero.tolist()], config[nonzero].tolist()))
 
     @property
     def config_array(self) -> np.ndarray:
@@ -644,34 +752,76 @@ class Simulation:
         The array is given in the same order as self.state_list. The index of state s
         is self.state_dict[s].
         """
-        return np.asarray(self.simulator.config)
+        return self._config_array
+
+    def _update_config_array(self) -> None:
+        """Caches an ndarray view of the simulator's configuration for config_array.
+
+        The simulator updates its configuration in place, so the view only has to be
+        recreated when simulator.reset gives it a new configuration array.
+        """
+        self._config_array = np.asarray(self.simulator.config)
 
     @property
     def history(self) -> pd.DataFrame:
         """A pandas dataframe containing the history of all recorded configurations."""
-        h = len(self._history)
-        if h < len(self.configs):
-            new_history = pd.DataFrame(data=self.configs[h:], index=pd.Index(self.times_in_units(self.times[h:])),
-                                       columns=self._history.columns)
-            self._history = pd.concat([self._history, new_history])
+        if self._history_len < self._num_configs:
+            # Rebuild the whole dataframe in a single allocation from the contiguous buffers,
+            # copying the rows, since reset will overwrite the buffer self._configs
+            self._history = pd.DataFrame(data=self.configs, index=self.time_index,
+                                         columns=self.column_names, copy=True)
+            self._history_len = self._num_configs
+        return self._history
+
+    @property
+    def time_index(self) -> pd.Index:
+        """A pandas index of all recorded times, converted by times_in_units.
+
+        This is the index of self.history. Only the times recorded since the last access
+        get converted, and are appended to the cached index.
+        """
+        if self._time_index_len < self._num_configs:
+            # copy, since reset will overwrite the buffer self._times
+            new_index = pd.Index(self.times_in_units(self._times[self._time_index_len:self._num_configs]),
+                                 copy=True)
+            if self._time_index is not None:
+                new_index = self._time_index.append(new_index)
             if self.time_units is None:
                 if self.continuous_time:
-                    self._history.index.name = 'time (continuous units)'
+                    new_index.name = 'time (continuous units)'
                 else:
-                    self._history.index.name = f'time ({self.steps_per_time_unit} interaction steps)'
-        return self._history
+                    new_index.name = f'time ({self.steps_per_time_unit} interaction steps)'
+            self._time_index = new_index
+            self._time_index_len = self._num_configs
+        return self._time_index
 
     def times_in_units(self, times):
         """If self.time_units is defined, convert time list to appropriate units."""
         if self.time_units:
-            return pd.to_timedelta(times, unit=self.time_units)
+            # convert to nanoseconds with one vectorized multiply, rather than through pd.to_timedelta,
+            # rounding the fractional part of each time the same way pd.to_timedelta does
+            unit_ns = pd.Timedelta(1, unit=self.time_units).value
+            times = np.asarray(times, dtype=np.float64)
+            if times.size > 0 and np.abs(times).max() * unit_ns >= 2 ** 63:
+                # out of the range of timedelta64[ns], so let pandas raise its error
+                return pd.to_timedelta(times, unit=self.time_units)
+            whole = times.astype(np.int64)
+            fraction = times - whole
+            if unit_ns > 1:
+                fraction = np.round(fraction, int(math.log10(unit_ns)))
+            return pd.TimedeltaIndex((whole * unit_ns + (fraction * unit_ns).astype(np.int64)).view('m8[ns]'))
         else:
             return times
 
     def add_config(self) -> None:
         """Appends the current simulator configuration and time."""
-        self.configs.append(np.array(self.simulator.config))
-        self.times.append(self.time)
+        if self._num_configs == len(self._configs):
+            # double the capacity of the full buffers
+            self._configs = np.concatenate([self._configs, np.empty_like(self._configs)])
+            self._times = np.concatenate([self._times, np.empty_like(self._times)])
+        np.copyto(self._configs[self._num_configs], self.simulator.config)
+        self._times[self._num_configs] = self.time
+        self._num_configs += 1
 
     def set_snapshot_time(self, time: float) -> None:
         """Updates all snapshots to the nearest recorded configuration to a specified time.
@@ -679,7 +829,9 @@ class Simulation:
         Args:
             time (float): The parallel time to update the snapshots to.
         """
-        index = np.searchsorted(self.times, time)
+        # a single binary search on the contiguous times buffer, shared by all snapshots,
+        # clamped to the last recorded configuration for times past the end
+        index = min(int(np.searchsorted(self.times, time)), self._num_configs - 1)
         for snapshot in self.snapshots:
             snapshot.update(index=index)
 
@@ -714,13 +866,14 @@ class Simulation:
         if var.lower() == 'index':
             return widgets.interactive(self.set_snapshot_index,
                                        index=widgets.IntSlider(min=0,
-                                                               max=len(self.times) - 1,
+                                                               max=self._num_configs - 1,
                                                                layout=widgets.Layout(width='100%'),
                                                                step=1))
         elif var.lower() == 'time':
+            times = self.times
             return widgets.interactive(self.set_snapshot_time,
-                                       time=widgets.FloatSlider(min=self.times[0],
-                                                                max=self.times[-1],
+                                       time=widgets.FloatSlider(min=float(times[0]),
+                                                                max=float(times[-1]),
                                                                 layout=widgets.Layout(width='100%'),
                                                                 step=0.01))
         else:
@@ -728,7 +881,7 @@ class Simulation:
 
     def sample_silence_time(self) -> float:
         """Starts a new trial from the initial distribution and return time until silence."""
-        if type(self.simulator) != simulator.SimulatorMultiBatch:
+        if not isinstance(self.simulator, simulator.SimulatorMultiBatch):
             raise ValueError('silence time can only be found by multibatch simulator.')
         self.simulator.run_until_silent(np.array(self.configs[0]))
         return self.time
@@ -743,29 +896,40 @@ class Simulation:
         Returns:
             A dataframe whose rows are the sampled configuration.
         """
-        samples = []
+        samples = np.empty((num_samples, len(self.state_list)), dtype=np.int64)
         t = self.simulator.t
-        for _ in tqdm(range(num_samples)):
-            self.simulator.reset(np.array(self.configs[-1]), t)
-            end_step = t + self.time_to_steps(time)
+        initial_config = self.configs[-1]
+        # in continuous time the number of steps is random, so it is sampled separately for each trial
+        steps = None if self.continuous_time else self.time_to_steps(time)
+        for i in tqdm(range(num_samples)):
+            # the simulator modifies the config array it is given, so each trial needs a fresh copy
+            self.simulator.reset(initial_config.copy(), t)
+            end_step = t + (self.time_to_steps(time) if steps is None else steps)
             self.simulator.run(end_step)
-            samples.append(np.array(self.simulator.config))
+            np.copyto(samples[i], self.simulator.config)
+        self._update_config_array()
         return pd.DataFrame(data=samples, index=pd.Index(range(num_samples), name='trial #'),
-                            columns=self._history.columns)
+                            columns=self.column_names, copy=False)
 
     def __getstate__(self):
         """Returns information to be pickled."""
-        # Clear _history such that it can be regenerated by self.history
         d = dict(self.__dict__)
-        d['_history'] = pd.DataFrame(data=self.configs[0:1], index=pd.Index(self.times_in_units(self.times[0:1])),
-                                     columns=self._history.columns)
+        # only pickle the recorded rows of the buffers
+        d['_configs'] = self.configs
+        d['_times'] = self.times
+        # Clear _history such that it can be regenerated by self.history
+        d['_history'] = None
+        d['_history_len'] = 0
+        d['_time_index'] = None
+        d['_time_index_len'] = 0
         del d['simulator']
+        del d['_config_array']
         return d
 
     def __setstate__(self, state) -> None:
         """Instantiates from the pickled state information."""
         self.__dict__ = state
-        self.initialize_simulator(self.configs[-1])
+        self.initialize_simulator(self.configs[-1].copy())
 
 class Plotter(Snapshot):
     """Base class for a Snapshot which will make a plot.
@@ -782,9 +946,13 @@ class Plotter(Snapshot):
             to view a subset of the states or just one field of the states.
         categories: A list which holds the set {state_map(state)} for all states
             in state_list. This gives the set of labels for the bars in the barplot.
-        _matrix: A (# states)x(# categories) matrix such that for the configuration
+        _matrix: A (# states)x(# categories) 0/1 matrix of uint8 such that for the configuration
             array self.config (indexed by states), matrix * config gives an array
             of counts of categories. Used internally for the update function.
+        _mapped_states: The indices of the states which state_map sends to a category.
+        _state_categories: The category index of each state in _mapped_states, so
+            summing config[_mapped_states] by _state_categories gives the same counts
+            as multiplying by _matrix without touching its zero entries.
     """
     def __init__(self, state_map=None, update_time=0.5) -> None:
         """Initializes the StatePlotter.
@@ -798,18 +966,18 @@ class Plotter(Snapshot):
 
     def _add_state_map(self, state_map):
         """An internal function called to update self.categories and self.matrix."""
-        self.categories = []
+        # call state_map only once per state
+        mapped = [state_map(state) for state in self.simulation.state_list]
         # categories will be ordered in the same order as state_list
-        for state in self.simulation.state_list:
-            if state_map(state) is not None and state_map(state) not in self.categories:
-                self.categories.append(state_map(state))
+        self.categories = list(dict.fromkeys(m for m in mapped if m is not None))
 
         categories_dict = {j: i for i, j in enumerate(self.categories)}
-        self._matrix = np.zeros((len(self.simulation.state_list), len(self.categories)), dtype=np.int64)
-        for i, state in enumerate(self.simulation.state_list):
-            m = state_map(state)
-            if m is not None:
-                self._matrix[i, categories_dict[m]] += 1
+        state_categories = np.fromiter((-1 if m is None else categories_dict[m] for m in mapped),
+                                       dtype=np.int32, count=len(mapped))
+        self._mapped_states = np.flatnonzero(state_categories >= 0)
+        self._state_categories = state_categories[self._mapped_states]
+        self._matrix = np.zeros((len(self.simulation.state_list), len(self.categories)), dtype=np.uint8)
+        self._matrix[self._mapped_states, self._state_categories] = 1
 
     def initialize(self) -> None:
         """Initializes the plotter by creating a fig and ax."""
@@ -836,44 +1004,93 @@ class StatePlotter(Plotter):
             for tick in self.ax.get_xticklabels():
                 tick.set_rotation(45)
         self.ax.set_ylim(0, self.simulation.simulator.n)
+        # only the bar heights and title change in update, so the layout is computed once here
+        self.fig.tight_layout()
 
     def update(self, index: Optional[int] = None) -> None:
         """Update the heights of all bars in the plot."""
         super().update(index)
         if self._matrix is not None:
-            heights = np.matmul(self.config, self._matrix)
+            heights = np.bincount(self._state_categories, weights=self.config[self._mapped_states],
+                                  minlength=len(self.categories))
         else:
             heights = self.config
-        for i, rect in enumerate(self.ax.patches):
-            rect.set_height(heights[i])
+        # tolist converts all heights at once, rather than indexing one numpy scalar per bar
+        for rect, height in zip(self.ax.patches, heights.tolist()):
+            rect.set_height(height)
 
         self.ax.set_title(f'Time {self.time}')
-        self.fig.tight_layout()
-        self.fig.canvas.draw()
+        self.fig.canvas.draw_idle()
 
 
 class HistoryPlotter(Plotter):
+    """Plotter which produces a lineplot of the counts over the whole history.
+
+    Attributes:
+        _lines: The line objects of the plot, one for each category, or None
+            before the first update.
+        _projection: A buffer whose first _projection_len rows hold the counts of
+            categories for the recorded configurations, so only new configurations
+            get multiplied by self._matrix.
+        _float_matrix: self._matrix as float64. Numpy only uses BLAS for floating point
+            matmul, and float64 sums of counts are exact for any population size below 2**53.
+    """
+
+    def initialize(self) -> None:
+        """Initializes the plot and clears the cached counts of categories."""
+        super().initialize()
+        self._float_matrix = None if self._matrix is None else self._matrix.astype(np.float64)
+        self.reset()
+
+    def reset(self) -> None:
+        """Clears the plotted lines and the cached counts of categories."""
+        self._lines = None
+        self._projection = None
+        self._projection_len = 0
+
+    def _projected_history(self) -> np.ndarray:
+        """The counts of categories for every recorded configuration."""
+        configs = self.simulation.configs
+        if self._matrix is None:
+            return configs
+        num_configs = len(configs)
+        if self._projection is None or len(self._projection) < num_configs:
+            # grow geometrically like the configs buffer, keeping the rows already computed
+            projection = np.empty((max(2 * num_configs, 64), len(self.categories)), dtype=np.int64)
+            if self._projection is not None:
+                projection[:self._projection_len] = self._projection[:self._projection_len]
+            self._projection = projection
+        if self._projection_len < num_configs:
+            self._projection[self._projection_len:num_configs] = \
+                configs[self._projection_len:].astype(np.float64) @ self._float_matrix
+            self._projection_len = num_configs
+        return self._projection[:num_configs]
 
     def update(self, index: Optional[int] = None) -> None:
         super().update(index)
-        self.ax.clear()
-        if self._matrix is not None:
-            df = pd.DataFrame(data=np.matmul(self.simulation.history.to_numpy(), self._matrix), columns=self.categories,
-                              index=self.simulation.history.index)
+        counts = self._projected_history()
+        time_index = self.simulation.time_index
+        times = np.asarray(time_index)
+        if self._lines is None:
+            self.ax.clear()
+            columns = self.categories if self._matrix is not None else self.simulation.column_names
+            pd.DataFrame(data=counts, columns=columns, index=time_index).plot(ax=self.ax)
+            self._lines = self.ax.get_lines()
+            # rotate the x labels if they are time units
+            if self.simulation.time_units:
+                self.ax.tick_params(axis='x', labelrotation=45)
         else:
-            df = self.simulation.history
-        df.plot(ax=self.ax)
-        # rotate the x labels if they are time units
-        if self.simulation.time_units:
-            for tick in self.ax.get_xticklabels():
-                tick.set_rotation(45)
-        self.fig.canvas.draw()
+            # move the existing lines rather than redrawing the whole plot
+            for k, line in enumerate(self._lines):
+                line.set_data(times, counts[:, k])
+            self.ax.relim()
+            self.ax.autoscale_view()
+        self.fig.canvas.draw_idle()
 
 
 def time_trials(rule: Rule, ns: List[int], initial_conditions: Union[Callable, List],
                 convergence_condition: Optional[Callable] = None, convergence_check_interval: float = 0.1,
-                num_trials: int = 100, max_wallclock_time: float = 60 * 60 * 24,
-
+                num_trials: int = 100, max_wallclock_time: float = 60 * 60 * 24, num_workers: int = 1,
                 **kwargs) -> pd.DataFrame:
     """Gathers data about the convergence time of a rule.
 
@@ -900,6 +1117,11 @@ def time_trials(rule: Rule, ns: List[int], initial_conditions: Union[Callable, L
             Each value n is given a time budget based on the time remaining, and
             will stop before doing num_trials runs when this time budget runs out.
             Defaults to 60 * 60 * 24 (one day).
+        num_workers: The number of processes used to run trials in parallel. Defaults to 1.
+            If larger than 1, the trials for each value n are split between a pool of
+            worker processes, so rule, initial_conditions and convergence_condition must
+            be picklable (for example, defined at the top level of a module rather than
+            as lambdas). Each worker gets its own seed spawned from kwargs['seed'].
         **kwargs: Other keyword arguments to pass into Simulation.
 
     Returns:
@@ -907,20 +1129,64 @@ def time_trials(rule: Rule, ns: List[int], initial_conditions: Union[Callable, L
             'n' and 'time'. A good way to visualize this dataframe is using the
             seaborn library, calling sns.lineplot(x='n', y='time', data=df).
     """
-    d = {'n': [], 'time': []}
+    # preallocate the columns for the largest possible number of trials, then trim at the end
+    n_column = np.empty(len(ns) * num_trials, dtype=np.int64)
+    time_column = np.empty(len(ns) * num_trials, dtype=float)
+    num_rows = 0
     end_time = perf_counter() + max_wallclock_time
     if callable(initial_conditions):
         initial_conditions = [initial_conditions(n) for n in ns]
-    for i in tqdm(range(len(ns))):
-        sim = Simulation(initial_conditions[i], rule, **kwargs)
-        t = perf_counter()
-        time_limit = t + (end_time - t) / (len(ns) - i)
-        j = 0
-        while j < num_trials and perf_counter() < time_limit:
-            j += 1
-            sim.reset(initial_conditions[i])
-            sim.run(convergence_condition, stopping_interval=convergence_check_interval, timer=False)
-            d['n'].append(ns[i])
-            d['time'].append(sim.time)
-
-    return pd.DataFrame(data=d)
+    if num_workers > 1:
+        # independent seeds for every worker process, for each value of n
+        seeds = [seed_sequence.spawn(num_workers)
+                 for seed_sequence in np.random.SeedSequence(kwargs.pop('seed', None)).spawn(len(ns))]
+        # split num_trials as evenly as possible between the workers
+        worker_num_trials = [num_trials // num_workers + (k < num_trials % num_workers) for k in range(num_workers)]
+    with ProcessPoolExecutor(num_workers) if num_workers > 1 else nullcontext() as executor:
+        for i in tqdm(range(len(ns))):
+            time_budget = (end_time - perf_counter()) / (len(ns) - i)
+            args = (rule, initial_conditions[i], convergence_condition, convergence_check_interval)
+            if num_workers > 1:
+                # workers without any trials are not submitted, so no Simulation is built for them
+                futures = [executor.submit(_sample_convergence_times, *args, worker_num_trials[k], time_budget,
+                                           seed=seeds[i][k], **kwargs)
+                           for k in range(num_workers) if worker_num_trials[k] > 0]
+                times = [time for future in futures for time in future.result()]
+            else:
+                times = _sample_convergence_times(*args, num_trials, time_budget, **kwargs)
+            n_column[num_rows:num_rows + len(times)] = ns[i]
+            time_column[num_rows:num_rows + len(times)] = times
+            num_rows += len(times)
+
+    return pd.DataFrame(data={'n': n_column[:num_rows], 'time': time_column[:num_rows]})
+
+
+def _sample_convergence_times(rule: Rule, initial_condition: Dict[State, int],
+                              convergence_condition: Optional[Callable], convergence_check_interval: float,
+                              num_trials: int, time_budget: float, **kwargs) -> List[float]:
+    """Runs up to num_trials trials of a Simulation and returns their convergence times.
+
+    This is a top level function so that time_trials can run it in worker processes.
+
+    Args:
+        rule: The rule that is used to generate the Simulation.
+        initial_condition: The initial configuration of every trial.
+        convergence_condition: The convergence condition passed to Simulation.run.
+        convergence_check_interval: The stopping_interval passed to Simulation.run.
+        num_trials: The maximum number of trials.
+        time_budget: A bound (in seconds) on how long the trials will run,
+            starting once the Simulation has been created.
+        **kwargs: Other keyword arguments to pass into Simulation.
+    """
+    if num_trials == 0:
+        return []
+    sim = Simulation(initial_condition, rule, **kwargs)
+    time_limit = perf_counter() + time_budget
+    times = []
+    while len(times) < num_trials and perf_counter() < time_limit:
+        # sim was created with initial_condition, so reset can copy the recorded initial configuration
+        # rather than converting the dict again
+        sim.reset()
+        sim.run(convergence_condition, stopping_interval=convergence_check_interval, timer=False)
+        times.append(sim.time)
+    return times
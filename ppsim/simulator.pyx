@@ -7,7 +7,7 @@
 '''
 
 from libc.math cimport log, lgamma, sqrt
-from libc.stdint cimport int64_t, uint8_t, uint32_t
+from libc.stdint cimport int32_t, int64_t, uint8_t, uint32_t
 cimport cython
 from numpy cimport npy_intp
 import numpy as np
@@ -39,31 +39,31 @@ cdef class Simulator:
     cdef public int64_t [::1] config
     cdef public int64_t n, t
     cdef npy_intp q
-    cdef public npy_intp [:,:,:,] delta
+    cdef public int32_t [:,:,:,] delta
     cdef public uint8_t [:,:] null_transitions
     cdef uint8_t is_random
-    cdef npy_intp [:,:,:] random_transitions
-    cdef npy_intp [:,:] random_outputs
+    cdef int32_t [:,:,:] random_transitions
+    cdef int32_t [:,:] random_outputs
     cdef double [::1] transition_probabilities
     cdef npy_intp random_depth
     cdef BitGenerator gen
     cdef bitgen_t *bitgen
 
     # random_outputs being typed causes an error when the protocol is not random and the array is empty.
-    def __init__(self, int64_t [::1] init_array, npy_intp [:,:,:] delta, uint8_t [:,:] null_transitions,
-                 npy_intp [:,:,:] random_transitions, random_outputs,
+    def __init__(self, int64_t [::1] init_array, int32_t [:,:,:] delta, uint8_t [:,:] null_transitions,
+                 int32_t [:,:,:] random_transitions, random_outputs,
                  double [::1] transition_probabilities, seed=None):
         """Initializes the main data structures for Simulator.
 
         Args:
             init_array: An integer array of counts representing the initial configuration.
-            delta: A q x q x 2 array representing the transition function.
+            delta: A q x q x 2 int32 array representing the transition function.
                 Delta[i, j] gives contains the two output states.
             null_transitions: A q x q boolean array where entry [i, j] says if these states have a null interaction.
-            random_transitions: A q x q x 2 array. Entry [i, j, 0] is the number of possible outputs if
+            random_transitions: A q x q x 2 int32 array. Entry [i, j, 0] is the number of possible outputs if
                 transition [i, j] is random, otherwise it is 0. Entry [i, j, 1] gives the starting index to find
                 the outputs in the array random_outputs if it is random.
-            random_outputs: An array containing all outputs of random transitions, whose indexing information
+            random_outputs: An int32 array containing all outputs of random transitions, whose indexing information
                 is contained in random_transitions.
             transition_probabilities: An array containing all random transition probabilities, whose indexing matches
                 random_outputs.
@@ -0,0 +1,184 @@
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from ppsim import Simulation, Snapshot, time_trials
+from ppsim.ppsim import _sample_convergence_times
+
+
+# approximate majority, defined at module level so that it can be pickled
+approximate_majority = {
+    ('A', 'B'): ('U', 'U'),
+    ('A', 'U'): ('A', 'A'),
+    ('B', 'U'): ('B', 'B'),
+}
+
+
+def reached_consensus(config):
+    # the configuration dict only contains states with positive counts
+    return len(config) == 1
+
+
+class CountingPoisson:
+    # wraps a Generator, counting how many poisson random variables get sampled
+
+    def __init__(self, rng: np.random.Generator) -> None:
+        self.rng = rng
+        self.num_samples = 0
+
+    def poisson(self, lam, size=None):
+        self.num_samples += 1 if size is None else size
+        return self.rng.poisson(lam, size)
+
+
+class TestSimulation(unittest.TestCase):
+    # tests running a Simulation
+
+    def setUp(self):
+        self.init_config = {'A': 510, 'B': 490}
+
+    def test_state_list_natural_order(self) -> None:
+        # integer states can be sorted directly only when that matches natsort's order of their repr
+        def rule(a, b):
+            return a, a
+
+        for states, expected in [([3, 10, 2], [2, 3, 10]),
+                                 ([-1, -2, 1], [1, -1, -2]),
+                                 ([(1,), (1, 2)], [(1, 2), (1,)]),
+                                 ([(2, 10), (2, 3), (1, 5)], [(1, 5), (2, 3), (2, 10)])]:
+            sim = Simulation({state: 1 for state in states}, rule, seed=0)
+            self.assertEqual(expected, sim.state_list)
+
+    def test_reset_restarts_time(self) -> None:
+        sim = Simulation(self.init_config, approximate_majority, seed=0, simulator_method='Sequential')
+        sim.run(2, 0.5, timer=False)
+        self.assertEqual(2, sim.time)
+        sim.reset()
+        self.assertEqual(0, sim.time)
+        sim.run(1, 0.5, timer=False)
+        self.assertEqual(1, sim.time)
+        self.assertEqual([0, 0.5, 1], sim.history.index.tolist())
+        self.assertTrue(sim.time_index.equals(sim.history.index))
+
+    def test_reset_keeps_initial_config(self) -> None:
+        sim = Simulation(self.init_config, approximate_majority, seed=0, simulator_method='Sequential')
+        initial_config = sim.array_from_dict(self.init_config)
+        sim.run(2, 0.5, timer=False)
+        sim.reset()
+        sim.run(1, 0.5, timer=False)
+        self.assertTrue(np.array_equal(initial_config, sim.configs[0]))
+        self.assertTrue(np.array_equal(initial_config, sim.history.iloc[0].to_numpy()))
+        # reset to a different configuration, then reset again to that configuration
+        sim.reset({'A': 300, 'B': 700})
+        sim.run(1, timer=False)
+        sim.reset()
+        self.assertEqual({'A': 300, 'B': 700}, sim.config_dict)
+        self.assertEqual(0, sim.history.index[0])
+
+    def test_set_snapshot_time(self) -> None:
+        sim = Simulation(self.init_config, approximate_majority, seed=0, simulator_method='Sequential')
+        sim.run(3, 0.5, timer=False)
+        snapshot = Snapshot()
+        sim.add_snapshot(snapshot)
+        # a time between two recorded times uses the first configuration recorded at or after it
+        sim.set_snapshot_time(1.2)
+        self.assertEqual(1.5, snapshot.time)
+        self.assertTrue(np.array_equal(sim.configs[3], snapshot.config))
+        sim.set_snapshot_time(1)
+        self.assertEqual(1, snapshot.time)
+        # a time past the end uses the last recorded configuration
+        sim.set_snapshot_time(99)
+        self.assertEqual(3, snapshot.time)
+        self.assertTrue(np.array_equal(sim.configs[-1], snapshot.config))
+
+    def test_poisson_samples_with_alternating_intervals(self) -> None:
+        # run steps to the next history time and the next stopping time, so the poisson mean keeps changing
+        sim = Simulation(self.init_config, approximate_majority, continuous_time=True, seed=0)
+        counting_rng = CountingPoisson(sim.rng)
+        sim.rng = counting_rng
+        num_calls = 0
+        time_to_steps = sim.time_to_steps
+
+        def counting_time_to_steps(time):
+            nonlocal num_calls
+            num_calls += 1
+            return time_to_steps(time)
+
+        sim.time_to_steps = counting_time_to_steps
+        sim.run(20, history_interval=1, stopping_interval=0.1, timer=False)
+        self.assertGreater(num_calls, 200)
+        self.assertLessEqual(counting_rng.num_samples, 2 * num_calls)
+
+    def test_poisson_samples_with_constant_interval(self) -> None:
+        sim = Simulation(self.init_config, approximate_majority, continuous_time=True, seed=0)
+        counting_rng = CountingPoisson(sim.rng)
+        sim.rng = counting_rng
+        steps = [sim.time_to_steps(0.1) for _ in range(1000)]
+        self.assertLessEqual(counting_rng.num_samples, 2 * len(steps))
+        # the mean is 0.1 * n steps
+        self.assertAlmostEqual(100, np.mean(steps), delta=5)
+
+    def test_times_in_units_matches_to_timedelta(self) -> None:
+        sim = Simulation(self.init_config, approximate_majority, seed=0)
+        rng = np.random.default_rng(0)
+        times = np.concatenate([[0, 0.1, 0.5, 1 / 3, 2.675, 1e-10],
+                                np.cumsum(rng.random(10000) * 0.1), rng.random(1000) * 1e3])
+        for time_units in ['s', 'ms', 'us', 'ns', 'min', 'h', 'D', 'W', 'seconds']:
+            sim.time_units = time_units
+            expected = pd.to_timedelta(times, unit=time_units)
+            self.assertTrue(expected.equals(sim.times_in_units(times)), time_units)
+            self.assertTrue(expected[:3].equals(sim.times_in_units(times[:3].tolist())), time_units)
+            self.assertTrue(expected[:0].equals(sim.times_in_units(times[:0])), time_units)
+
+    def test_times_in_units_out_of_range(self) -> None:
+        # about 292 years is the largest timedelta64[ns], so these times are handled by pd.to_timedelta
+        sim = Simulation(self.init_config, approximate_majority, seed=0)
+        times = np.array([1.0, 200000.0])
+        for time_units in ['D', 'W']:
+            sim.time_units = time_units
+            try:
+                expected = pd.to_timedelta(times, unit=time_units)
+            except (OverflowError, ValueError) as e:
+                with self.assertRaises(type(e)):
+                    sim.times_in_units(times)
+            else:
+                self.assertTrue(expected.equals(sim.times_in_units(times)), time_units)
+
+
+class TestTimeTrials(unittest.TestCase):
+    # tests gathering convergence times with time_trials
+
+    def setUp(self):
+        self.ns = [20, 40]
+
+    def initial_condition(self, n):
+        return {'A': n // 2 + 1, 'B': n // 2 - 1}
+
+    def test_parallel_trials_per_n(self) -> None:
+        for num_trials in [5, 2, 1]:
+            # passing seed checks that it is replaced by the spawned worker seeds rather than forwarded twice
+            df = time_trials(approximate_majority, self.ns, self.initial_condition, reached_consensus,
+                             num_trials=num_trials, num_workers=2, seed=1, simulator_method='Sequential')
+            self.assertEqual(list(df.columns), ['n', 'time'])
+            self.assertEqual(self.ns, sorted(df['n'].unique().tolist()))
+            for n in self.ns:
+                self.assertEqual(num_trials, (df['n'] == n).sum())
+            self.assertTrue((df['time'] > 0).all())
+
+    def test_parallel_trials_seed(self) -> None:
+        kwargs = dict(num_trials=4, num_workers=2, seed=3, simulator_method='Sequential')
+        df1 = time_trials(approximate_majority, self.ns, self.initial_condition, reached_consensus, **kwargs)
+        df2 = time_trials(approximate_majority, self.ns, self.initial_condition, reached_consensus, **kwargs)
+        self.assertTrue(df1.equals(df2))
+
+    def test_sample_convergence_times(self) -> None:
+        # no Simulation is built without trials, so even an invalid rule is not evaluated
+        self.assertEqual([], _sample_convergence_times(None, self.initial_condition(20), None, 0.1, 0, 60))
+        times = _sample_convergence_times(approximate_majority, self.initial_condition(20), reached_consensus, 0.1,
+                                          3, 60, seed=1, simulator_method='Sequential')
+        self.assertEqual(3, len(times))
+
+
+if __name__ == '__main__':
+    unittest.main()